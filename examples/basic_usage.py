@@ -8,6 +8,10 @@ sys.path.insert(0, '../src')
 from domain_finder.generator import NameGenerator
 from domain_finder.checker import AvailabilityChecker
 
+AVAILABLE_LINE = "✓ {:<20} AVAILABLE"
+TAKEN_LINE = "✗ {:<20} TAKEN (IP: {})"
+UNKNOWN_LINE = "? {:<20} UNKNOWN"
+
 
 def main():
     print("=" * 60)
@@ -30,25 +34,22 @@ def main():
     
     # Step 2: Check availability
     print("[2] Checking availability...\n")
-    checker = AvailabilityChecker(max_workers=5)
+    checker = AvailabilityChecker()
     results = checker.check_batch(domains)
     
     # Step 3: Display results
     print("[3] Results:\n")
-    available = []
-    taken = []
-    unknown = []
+    available = [r["domain"] for r in results if r["status"] == "AVAILABLE"]
+    taken = [r for r in results if r["status"] == "TAKEN"]
+    unknown = [r["domain"] for r in results if r["status"] not in ("AVAILABLE", "TAKEN")]
     
-    for result in results:
-        if result["status"] == "AVAILABLE":
-            available.append(result["domain"])
-            print(f"✓ {result['domain']:<20} AVAILABLE")
-        elif result["status"] == "TAKEN":
-            taken.append(result["domain"])
-            print(f"✗ {result['domain']:<20} TAKEN (IP: {result['ip']})")
-        else:
-            unknown.append(result["domain"])
-            print(f"? {result['domain']:<20} UNKNOWN")
+    # Format each category in one pass and write it with a single call
+    avail_lines = [AVAILABLE_LINE.format(domain) for domain in available]
+    taken_lines = [TAKEN_LINE.format(r["domain"], r["ip"]) for r in taken]
+    unk_lines = [UNKNOWN_LINE.format(domain) for domain in unknown]
+    for lines in (avail_lines, taken_lines, unk_lines):
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
     
     # Step 4: Summary
     print("\n" + "=" * 60)
@@ -37,6 +37,9 @@ setup(
         "pydantic>=2.0.0",
     ],
     extras_require={
+        "fast": [
+            "numpy>=1.17.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
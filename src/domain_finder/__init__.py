@@ -10,8 +10,9 @@ __license__ = "MIT"
 try:
     from .generator import NameGenerator
     from .checker import AvailabilityChecker
+    from .finder import DomainFinder
 except ImportError:
     # During initial setup, these might not exist yet
     pass
 
-__all__ = ["NameGenerator", "AvailabilityChecker"]
+__all__ = ["NameGenerator", "AvailabilityChecker", "DomainFinder"]
@@ -2,31 +2,415 @@
 Availability checking module - checks if domains are registered using DNS
 """
 
+import asyncio
+import random
+import re
+import select
 import socket
-from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import struct
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+import dns.asyncresolver
+import dns.exception
+import dns.inet
+import dns.message
+import dns.name
+import dns.rcode
+import dns.rdatatype
+import dns.resolver
+
+if TYPE_CHECKING:
+    # Type-only import; keeps pydantic out of the checker's import path
+    from .models import DomainCheckResultDict
+
+
+# Domains may be str or ASCII bytes (NameGenerator.generate(as_bytes=True))
+Domain = Union[str, bytes]
+
+# getaddrinfo error codes meaning the name does not exist. EAI_NODATA is not
+# one: the name exists but has no A record, so it is registered.
+_NXDOMAIN_ERRNOS = frozenset({socket.EAI_NONAME})
+
+# Header flags (RD) and counts (one question) shared by every raw query, and
+# the QTYPE=A, QCLASS=IN trailer after the name
+_QUERY_HEADER = struct.Struct("!HHHHHH")
+_QUERY_A_IN = b"\x00\x01\x00\x01"
+
+# One lower-cased hostname label: 1-63 letters, digits or hyphens, with no
+# leading or trailing hyphen
+_LABEL_RE = re.compile(rb"[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\Z")
+
+
+def _encode_qname(domain: Domain) -> bytes:
+    """
+    Encode domain as uncompressed, lower-cased DNS wire labels.
+    
+    e.g. "test.com" -> b"\\x04test\\x03com\\x00". ASCII names are encoded
+    directly and must follow the hostname rules (letters, digits and
+    hyphens, no hyphen at either end of a label); anything else goes through
+    dnspython's IDNA handling.
+    
+    Raises:
+        ValueError: If the name is not a valid DNS name
+    """
+    try:
+        raw = domain if isinstance(domain, bytes) else domain.encode("ascii")
+    except UnicodeEncodeError:
+        try:
+            return dns.name.from_text(domain).to_wire().lower()
+        except dns.exception.DNSException as e:
+            raise ValueError(str(e)) from e
+    
+    name = raw.lower()
+    if name.endswith(b"."):
+        name = name[:-1]
+    labels = name.split(b".")
+    if len(name) > 253 or not all(_LABEL_RE.match(label) for label in labels):
+        raise ValueError(f"invalid domain name: {domain!r}")
+    return b"".join([bytes((len(label),)) + label for label in labels]) + b"\x00"
+
+
+class _RawDnsBatch:
+    """
+    Pipelines A queries for many domains over connected UDP sockets.
+    
+    Replies are matched to queries by transaction ID and question name.
+    Queries without a reply within the timeout are resent up to
+    retry_attempts times, rotating through the nameservers so a dead one is
+    skipped. Names are always queried fully-qualified, without the
+    resolv.conf search list.
+    """
+    
+    def __init__(
+        self,
+        nameservers: List[Tuple[str, int]],
+        timeout: float,
+        retry_attempts: int,
+    ):
+        self.nameservers = nameservers
+        self.timeout = timeout
+        self.retry_attempts = retry_attempts
+        self._sockets: Dict[Tuple[str, int], socket.socket] = {}
+        self._ids = random.Random()
+        self._lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Close every UDP socket."""
+        with self._lock:
+            for sock in self._sockets.values():
+                sock.close()
+            self._sockets.clear()
+    
+    def _socket(self, nameserver: Tuple[str, int]) -> Optional[socket.socket]:
+        """Return a socket connected to nameserver, or None if unreachable."""
+        sock = self._sockets.get(nameserver)
+        if sock is not None:
+            return sock
+        family = socket.AF_INET6 if ":" in nameserver[0] else socket.AF_INET
+        try:
+            sock = socket.socket(family, socket.SOCK_DGRAM)
+        except OSError:
+            # e.g. an IPv6 nameserver on a host with IPv6 disabled
+            return None
+        try:
+            sock.connect(nameserver)
+        except OSError:
+            # e.g. no route to the nameserver
+            sock.close()
+            return None
+        self._sockets[nameserver] = sock
+        return sock
+    
+    def resolve(self, domains: List[Domain], window: int) -> Dict[Domain, "DomainCheckResultDict"]:
+        """
+        Resolve distinct domains with at most ``window`` queries in flight.
+        
+        Domains that get no reply from any reachable nameserver are UNKNOWN.
+        
+        Returns:
+            Dictionary mapping each domain to its check result
+        """
+        results: Dict[Domain, "DomainCheckResultDict"] = {}
+        
+        # Encode every name once, up front, for all attempts
+        qnames: Dict[Domain, bytes] = {}
+        for domain in domains:
+            try:
+                qnames[domain] = _encode_qname(domain)
+            except ValueError:
+                results[domain] = {
+                    "domain": domain,
+                    "status": "UNKNOWN",
+                    "ip": None
+                }
+        remaining = list(qnames)
+        
+        # A socket serves one batch at a time, or replies get mixed up
+        with self._lock:
+            for attempt in range(1 + self.retry_attempts):
+                if not remaining or not self.nameservers:
+                    break
+                sock = self._socket(self.nameservers[attempt % len(self.nameservers)])
+                if sock is not None:
+                    remaining = self._attempt(sock, remaining, qnames, window, results)
+        
+        for domain in remaining:
+            results[domain] = {
+                "domain": domain,
+                "status": "UNKNOWN",
+                "ip": None
+            }
+        return results
+    
+    def _attempt(
+        self,
+        sock: socket.socket,
+        domains: List[Domain],
+        qnames: Dict[Domain, bytes],
+        window: int,
+        results: Dict[Domain, "DomainCheckResultDict"],
+    ) -> List[Domain]:
+        """Query every domain once; return the ones that got no reply in time."""
+        queue = deque(domains)
+        # Insertion order is send order, so the first entry expires first
+        inflight: Dict[int, Tuple[Domain, bytes, float]] = {}
+        lost: List[Domain] = []
+        window = max(1, min(window, 0xFFFF))
+        
+        while queue or inflight:
+            while queue and len(inflight) < window:
+                domain = queue.popleft()
+                qname = qnames[domain]
+                qid = self._ids.getrandbits(16)
+                while qid in inflight:
+                    qid = self._ids.getrandbits(16)
+                try:
+                    sock.send(_QUERY_HEADER.pack(qid, 0x0100, 1, 0, 0, 0) + qname + _QUERY_A_IN)
+                except OSError:
+                    lost.append(domain)
+                    continue
+                inflight[qid] = (domain, qname, time.monotonic() + self.timeout)
+            
+            if not inflight:
+                continue
+            
+            deadline = next(iter(inflight.values()))[2]
+            readable, _, _ = select.select(
+                [sock], [], [], max(0.0, deadline - time.monotonic())
+            )
+            if readable:
+                self._receive(sock, inflight, results)
+            
+            now = time.monotonic()
+            while inflight:
+                qid, (domain, _, expires) = next(iter(inflight.items()))
+                if expires > now:
+                    break
+                del inflight[qid]
+                lost.append(domain)
+        
+        return lost
+    
+    def _receive(
+        self,
+        sock: socket.socket,
+        inflight: Dict[int, Tuple[Domain, bytes, float]],
+        results: Dict[Domain, "DomainCheckResultDict"],
+    ) -> None:
+        """Read one reply and record the result of the query it answers."""
+        try:
+            wire = sock.recv(65535)
+            response = dns.message.from_wire(wire)
+        except (OSError, dns.exception.DNSException):
+            # ICMP errors surface on connected sockets; garbage is ignored
+            return
+        
+        entry = inflight.get(response.id)
+        if (
+            entry is None
+            or not response.question
+            or response.question[0].name.to_wire().lower() != entry[1]
+        ):
+            # Late reply to an earlier attempt or batch
+            return
+        del inflight[response.id]
+        
+        domain = entry[0]
+        rcode = response.rcode()
+        if rcode == dns.rcode.NXDOMAIN:
+            results[domain] = {
+                "domain": domain,
+                "status": "AVAILABLE",
+                "ip": None
+            }
+            return
+        if rcode == dns.rcode.NOERROR:
+            for rrset in response.answer:
+                if rrset.rdtype == dns.rdatatype.A:
+                    results[domain] = {
+                        "domain": domain,
+                        "status": "TAKEN",
+                        "ip": rrset[0].address
+                    }
+                    return
+        results[domain] = {
+            "domain": domain,
+            "status": "UNKNOWN",
+            "ip": None
+        }
 
 
 class AvailabilityChecker:
     """Checks domain availability using DNS resolution."""
     
-    def __init__(self, max_workers: int = 5, timeout: int = 3):
+    # Upper bound on cached domains before the least recently used is evicted
+    CACHE_MAX_ENTRIES = 10000
+    
+    # Outstanding queries when max_workers is not set. Lookups are bound by
+    # network round-trips, not CPU, so throughput grows with the number in
+    # flight until the resolver or network saturates. This has not been
+    # benchmarked: one local caching resolver started dropping replies at
+    # about 50 outstanding queries. Dropped queries are retried and are
+    # UNKNOWN only if every retry is lost; lower max_workers for resolvers
+    # like that.
+    MAX_AUTO_WORKERS = 64
+    
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout: int = 3,
+        cache_ttl: float = 300,
+        retry_attempts: int = 2,
+    ):
         """
         Initialize the availability checker.
         
         Args:
-            max_workers: Maximum parallel DNS lookups
-            timeout: DNS lookup timeout in seconds
+            max_workers: Maximum parallel DNS lookups in check_batch(); None
+                sizes it to the batch, up to MAX_AUTO_WORKERS
+            timeout: DNS lookup timeout in seconds for check_batch(); check()
+                relies on the system resolver's own timeout
+            cache_ttl: Seconds a TAKEN/AVAILABLE result is reused (0 disables)
+            retry_attempts: Times check_batch() resends an unanswered query
         """
         self.max_workers = max_workers
         self.timeout = timeout
+        self.retry_attempts = retry_attempts
+        self._cache_ttl = cache_ttl
+        # check() goes through the system resolver (/etc/hosts, search list)
+        # while check_async()/check_batch() query DNS directly; they can
+        # disagree about a name, so each kind keeps its own results
+        self._cache: "OrderedDict[Domain, Tuple[float, DomainCheckResultDict]]" = OrderedDict()
+        self._system_cache: "OrderedDict[Domain, Tuple[float, DomainCheckResultDict]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Built on first use, so construction never depends on resolv.conf
+        self._resolver: Optional[dns.asyncresolver.Resolver] = None
+        self._raw_batch: Optional[_RawDnsBatch] = None
+        self._setup_lock = threading.Lock()
     
-    def check(self, domain: str) -> Dict[str, Any]:
+    def _get_resolver(self) -> dns.asyncresolver.Resolver:
+        """
+        Return the resolver shared by every query, creating it on first use.
+        
+        Raises:
+            dns.resolver.NoResolverConfiguration: If no nameservers are configured
+        """
+        with self._setup_lock:
+            if self._resolver is None:
+                # resolv.conf is parsed once, here
+                resolver = dns.asyncresolver.Resolver(configure=True)
+                resolver.lifetime = self.timeout
+                self._resolver = resolver
+            return self._resolver
+    
+    def _get_raw_batch(self) -> _RawDnsBatch:
+        """Return the pipelining client for check_batch(), creating it on first use."""
+        try:
+            resolver = self._get_resolver()
+        except dns.exception.DNSException:
+            resolver = None
+        
+        with self._setup_lock:
+            if self._raw_batch is not None:
+                return self._raw_batch
+            nameservers = []
+            if resolver is not None:
+                for nameserver in resolver.nameservers:
+                    nameserver = str(nameserver)
+                    # Only plain IP nameservers; DoH/DoT entries are skipped
+                    if dns.inet.is_address(nameserver):
+                        port = resolver.nameserver_ports.get(nameserver, resolver.port)
+                        nameservers.append((nameserver, port))
+            raw_batch = _RawDnsBatch(nameservers, self.timeout, self.retry_attempts)
+            # Without nameservers every answer is UNKNOWN; don't keep that
+            # client, so setup is retried once resolv.conf is fixed
+            if nameservers:
+                self._raw_batch = raw_batch
+            return raw_batch
+    
+    def _cache_get(
+        self,
+        cache: "OrderedDict[Domain, Tuple[float, DomainCheckResultDict]]",
+        domain: Domain,
+    ) -> Optional["DomainCheckResultDict"]:
+        """Return a fresh result for domain from cache, or None."""
+        with self._cache_lock:
+            hit = cache.get(domain)
+            if hit is None:
+                return None
+            if time.monotonic() - hit[0] >= self._cache_ttl:
+                del cache[domain]
+                return None
+            cache.move_to_end(domain)
+            return dict(hit[1])
+    
+    def _cache_put(
+        self,
+        cache: "OrderedDict[Domain, Tuple[float, DomainCheckResultDict]]",
+        result: "DomainCheckResultDict",
+    ) -> "DomainCheckResultDict":
+        """Store a definitive result in cache; UNKNOWN is transient and never cached."""
+        if self._cache_ttl <= 0 or result["status"] == "UNKNOWN":
+            return result
+        with self._cache_lock:
+            cache[result["domain"]] = (time.monotonic(), dict(result))
+            cache.move_to_end(result["domain"])
+            if len(cache) > self.CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+        return result
+    
+    def is_known_taken(self, domain: Domain) -> bool:
+        """Return True if a fresh check_batch()/check_async() result says domain is TAKEN."""
+        cached = self._cache_get(self._cache, domain)
+        return cached is not None and cached["status"] == "TAKEN"
+    
+    def clear_cache(self) -> None:
+        """Forget all cached results."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._system_cache.clear()
+    
+    def close(self) -> None:
+        """Release the UDP sockets used by check_batch()."""
+        with self._setup_lock:
+            raw_batch, self._raw_batch = self._raw_batch, None
+        if raw_batch is not None:
+            raw_batch.close()
+    
+    def _workers(self, count: int) -> int:
+        """Number of queries to keep in flight for a batch of count domains."""
+        return self.max_workers or min(count, self.MAX_AUTO_WORKERS) or 1
+    
+    def check(self, domain: Domain) -> "DomainCheckResultDict":
         """
         Check if a single domain is available.
         
         Args:
-            domain: Domain name to check (with or without TLD)
+            domain: Domain name to check (str or ASCII bytes)
         
         Returns:
             Dictionary with keys:
@@ -34,70 +418,144 @@ class AvailabilityChecker:
             - status: "AVAILABLE", "TAKEN", or "UNKNOWN"
             - ip: IP address if TAKEN, None otherwise
         """
+        cached = self._cache_get(self._system_cache, domain)
+        if cached is not None:
+            return cached
+        
         try:
-            # Attempt DNS resolution
-            ip = socket.gethostbyname(domain)
-            return {
+            # IPv4 only and no service lookup: one A query, no /etc/services.
+            # No AI_ADDRCONFIG: without an IPv4 address glibc would return
+            # EAI_NONAME unsent, which reads as AVAILABLE.
+            infos = socket.getaddrinfo(
+                domain, None,
+                family=socket.AF_INET, type=socket.SOCK_DGRAM,
+                flags=socket.AI_NUMERICSERV
+            )
+            return self._cache_put(self._system_cache, {
                 "domain": domain,
                 "status": "TAKEN",
-                "ip": ip
-            }
+                "ip": infos[0][4][0]
+            })
         except socket.gaierror as e:
-            error_msg = str(e).lower()
-            # Check if domain not found
-            if "nodename nor servname provided" in error_msg or "name or service not known" in error_msg:
-                return {
+            # Classify by error code; the message text depends on libc and locale
+            if e.errno in _NXDOMAIN_ERRNOS:
+                return self._cache_put(self._system_cache, {
                     "domain": domain,
                     "status": "AVAILABLE",
                     "ip": None
-                }
-            else:
-                return {
-                    "domain": domain,
-                    "status": "UNKNOWN",
-                    "ip": None
-                }
-        except socket.timeout:
+                })
             return {
                 "domain": domain,
                 "status": "UNKNOWN",
                 "ip": None
             }
-        except Exception as e:
+        except Exception:
             return {
                 "domain": domain,
                 "status": "UNKNOWN",
                 "ip": None
             }
     
-    def check_batch(self, domains: List[str]) -> List[Dict[str, Any]]:
+    async def check_async(self, domain: Domain) -> "DomainCheckResultDict":
         """
-        Check multiple domains in parallel.
+        Check if a single domain is available without blocking the event loop.
+        
+        Args:
+            domain: Domain name to check (with or without TLD)
+        
+        Returns:
+            Same dictionary as check()
+        """
+        cached = self._cache_get(self._cache, domain)
+        if cached is not None:
+            return cached
+        return self._cache_put(self._cache, await self._resolve_one(domain))
+    
+    async def _resolve_one(self, domain: Domain) -> "DomainCheckResultDict":
+        """Resolve domain's A record over the network, bypassing the cache."""
+        try:
+            # The resolver only parses str itself; bytes go straight to Name
+            qname = dns.name.from_text(domain, None) if isinstance(domain, bytes) else domain
+            answer = await self._get_resolver().resolve(qname, "A")
+            return {
+                "domain": domain,
+                "status": "TAKEN",
+                "ip": answer.rrset[0].address
+            }
+        except dns.resolver.NXDOMAIN:
+            return {
+                "domain": domain,
+                "status": "AVAILABLE",
+                "ip": None
+            }
+        except (dns.resolver.NoAnswer, dns.exception.Timeout):
+            return {
+                "domain": domain,
+                "status": "UNKNOWN",
+                "ip": None
+            }
+        except Exception:
+            return {
+                "domain": domain,
+                "status": "UNKNOWN",
+                "ip": None
+            }
+    
+    def check_batch(self, domains: List[Domain]) -> List["DomainCheckResultDict"]:
+        """
+        Check multiple domains, pipelining queries over one UDP socket.
+        
+        Each distinct domain is resolved once; cached results are reused.
+        Queries go straight to the configured nameservers.
         
         Args:
             domains: List of domain names to check
         
         Returns:
-            List of check results
+            List of check results, in the same order as ``domains``
         """
-        results = []
+        by_domain: Dict[Domain, "DomainCheckResultDict"] = {}
+        misses = []
+        for domain in dict.fromkeys(domains):
+            cached = self._cache_get(self._cache, domain)
+            if cached is None:
+                misses.append(domain)
+            else:
+                by_domain[domain] = cached
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_domain = {
-                executor.submit(self.check, domain): domain 
-                for domain in domains
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_domain):
-                result = future.result()
-                results.append(result)
+        if misses:
+            resolved = self._get_raw_batch().resolve(misses, self._workers(len(misses)))
+            for domain in misses:
+                by_domain[domain] = self._cache_put(self._cache, resolved[domain])
+        
+        return [by_domain[d] for d in domains]
+    
+    async def check_batch_async(self, domains: List[Domain]) -> List["DomainCheckResultDict"]:
+        """
+        Check multiple domains concurrently from inside a running event loop.
+        
+        At most ``max_workers`` queries are outstanding at any time. Each
+        distinct domain is resolved once, however often it appears.
+        
+        Args:
+            domains: List of domain names to check
+        
+        Returns:
+            List of check results, in the same order as ``domains``
+        """
+        unique = list(dict.fromkeys(domains))
+        semaphore = asyncio.Semaphore(self._workers(len(unique)))
+        
+        async def guarded(domain: Domain) -> "DomainCheckResultDict":
+            async with semaphore:
+                return await self.check_async(domain)
+        
+        results = await asyncio.gather(*[guarded(d) for d in unique])
+        by_domain = dict(zip(unique, results))
         
-        # Return results in original order (optional, for consistency)
-        return sorted(results, key=lambda x: x["domain"])
+        return [by_domain[d] for d in domains]
     
-    def get_summary(self, results: List[Dict[str, Any]]) -> Dict[str, int]:
+    def get_summary(self, results: List["DomainCheckResultDict"]) -> Dict[str, int]:
         """
         Get a summary of check results.
         
@@ -0,0 +1,87 @@
+"""
+Search module - generates and checks names until enough are available
+"""
+
+import math
+from typing import Any, List, Optional
+
+from .checker import AvailabilityChecker, Domain
+from .generator import NameGenerator
+
+
+class DomainFinder:
+    """Finds available domains by streaming generated names into the checker."""
+    
+    # Names generated per wanted domain before any hit rate is known
+    OVERSAMPLE = 10
+    
+    # Upper bound on names generated in one round
+    MAX_BATCH = 10000
+    
+    def __init__(
+        self,
+        generator: Optional[NameGenerator] = None,
+        checker: Optional[AvailabilityChecker] = None,
+        max_rounds: int = 10,
+    ):
+        """
+        Initialize the domain finder.
+        
+        Args:
+            generator: Name generator to draw candidates from
+            checker: Availability checker; its cache is shared across searches
+            max_rounds: Maximum generate/check rounds per search
+        """
+        self.generator = generator or NameGenerator()
+        self.checker = checker or AvailabilityChecker()
+        self.max_rounds = max_rounds
+    
+    def find_available(self, target_k: int, **gen_kwargs: Any) -> List[Domain]:
+        """
+        Find up to target_k available domains.
+        
+        Each round generates a batch of candidates, drops names already seen
+        in this search or cached as TAKEN, and checks the rest. A round is
+        sized from the domains still needed and the hit rate seen so far
+        (doubling while nothing has been found), capped at MAX_BATCH names.
+        
+        Args:
+            target_k: Number of available domains wanted
+            **gen_kwargs: Passed to NameGenerator.generate() (except count)
+        
+        Returns:
+            List of available domains, at most target_k long
+        """
+        found: List[Domain] = []
+        seen = set()
+        generated = 0
+        batch = target_k * self.OVERSAMPLE
+        
+        for _ in range(self.max_rounds):
+            needed = target_k - len(found)
+            if needed <= 0:
+                break
+            
+            if found:
+                # Names per available domain so far, with 25% headroom
+                batch = math.ceil(needed * generated / len(found) * 1.25)
+            batch = max(1, min(batch, self.MAX_BATCH))
+            generated += batch
+            
+            candidates = []
+            for domain in self.generator.generate(count=batch, **gen_kwargs):
+                if domain in seen:
+                    continue
+                seen.add(domain)
+                # Names known to be taken never reach DNS
+                if not self.checker.is_known_taken(domain):
+                    candidates.append(domain)
+            
+            for result in self.checker.check_batch(candidates):
+                if result["status"] == "AVAILABLE":
+                    found.append(result["domain"])
+            
+            # Only used while nothing has been found yet
+            batch *= 2
+        
+        return found[:target_k]
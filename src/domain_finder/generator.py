@@ -2,8 +2,16 @@
 Name generation module - generates pronounceable domain names
 """
 
+import functools
 import random
-from typing import List, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy is optional; fall back to specialized pure-Python generation
+    np = None
 
 
 class NameGenerator:
@@ -13,10 +21,23 @@ class NameGenerator:
     VOWELS = "aeiou"
     CONSONANTS = "bcdfghjklmnpqrstvwxyz"
     
+    # Upper bound on cached slot tables and compiled generators, each, before
+    # the least recently used is evicted
+    CACHE_MAX_ENTRIES = 128
+    
     def __init__(self):
         """Initialize the name generator."""
         self.vowels = self.VOWELS
         self.consonants = self.CONSONANTS
+        self._codegen_cache: "OrderedDict[Tuple, Callable[[int], List[str]]]" = OrderedDict()
+        self._slot_cache: "OrderedDict[Tuple, Tuple]" = OrderedDict()
+        self._rng = random.Random()
+        # (consonants, vowels, consonant array, vowel array), rebuilt whenever
+        # the public vowels/consonants attributes change
+        self._np_alphabets: Optional[Tuple] = None
+        
+        if np is not None:
+            self._np_rng = np.random.default_rng()
     
     def generate(
         self,
@@ -26,7 +47,8 @@ class NameGenerator:
         prefix: Optional[str] = None,
         suffix: Optional[str] = None,
         tlds: Optional[List[str]] = None,
-    ) -> List[str]:
+        as_bytes: bool = False,
+    ) -> Union[List[str], List[bytes]]:
         """
         Generate pronounceable domain names.
         
@@ -37,6 +59,8 @@ class NameGenerator:
             prefix: Optional prefix that names must start with
             suffix: Optional suffix that names must end with
             tlds: List of TLDs to use (e.g., ["com", "io", "co"])
+            as_bytes: Return ASCII bytes instead of str; AvailabilityChecker
+                accepts either and bytes skip re-encoding in the resolver
         
         Returns:
             List of domain names (with TLDs)
@@ -44,54 +68,195 @@ class NameGenerator:
         if tlds is None:
             tlds = ["com"]
         
-        names = []
+        if np is None:
+            return self._specialized(length, pattern, prefix, suffix, tlds, as_bytes)(count)
         
-        for _ in range(count):
-            if pattern:
-                name = self._generate_by_pattern(length, pattern)
-            else:
-                name = self._generate_cvccvc(length)
-            
-            # Apply constraints
-            if prefix and not name.startswith(prefix):
-                name = prefix + name[len(prefix):]
+        bases = self._generate_vectorized(count, length, pattern, as_bytes)
+        
+        if as_bytes:
+            head = prefix.encode("ascii") if prefix else b""
+            tail = suffix.encode("ascii") if suffix else b""
+            tld_suffixes = [b"." + tld.encode("ascii") for tld in tlds]
+        else:
+            head = prefix or ""
+            tail = suffix or ""
+            tld_suffixes = ["." + tld for tld in tlds]
+        
+        # Apply constraints
+        if head:
+            bases = [head + name[len(head):] for name in bases]
+        
+        if tail:
+            bases = [name[:-len(tail)] + tail for name in bases]
+        
+        # Add TLDs
+        return [name + tld for name in bases for tld in tld_suffixes]
+    
+    def _slot_variants(self, length: int, pattern: Optional[str]) -> List[str]:
+        """
+        Return the slot layouts a name may follow.
+        
+        Each layout has one character per position: "C" for a consonant,
+        "V" for a vowel, anything else is copied into the name as-is.
+        """
+        if pattern and len(pattern) == length:
+            return [pattern.upper()]
+        # Alternating pattern, starting with a consonant or a vowel
+        return [("CV" * length)[:length], ("VC" * length)[:length]]
+    
+    def _generate_vectorized(
+        self,
+        count: int,
+        length: int,
+        pattern: Optional[str],
+        as_bytes: bool = False,
+    ) -> Union[List[str], List[bytes]]:
+        """Generate all base names at once as a (count, length) character matrix."""
+        if count <= 0:
+            return []
+        if length <= 0:
+            return [b"" if as_bytes else ""] * count
+        
+        key = (length, pattern)
+        tables = self._slot_cache.get(key)
+        if tables is None:
+            slots = np.array(
+                [list(variant) for variant in self._slot_variants(length, pattern)],
+                dtype="U1"
+            )
+            tables = (slots, slots == "C", slots == "V")
+            self._slot_cache[key] = tables
+            if len(self._slot_cache) > self.CACHE_MAX_ENTRIES:
+                self._slot_cache.popitem(last=False)
+        else:
+            self._slot_cache.move_to_end(key)
+        slots, consonant_mask, vowel_mask = tables
+        
+        alphabets = self._np_alphabets
+        if alphabets is None or alphabets[:2] != (self.consonants, self.vowels):
+            alphabets = (
+                self.consonants,
+                self.vowels,
+                np.array(list(self.consonants), dtype="U1"),
+                np.array(list(self.vowels), dtype="U1"),
+            )
+            self._np_alphabets = alphabets
+        consonants, vowels = alphabets[2:]
+        
+        # Pick a slot variant per name; literal characters are copied through
+        rows = self._np_rng.integers(0, len(slots), size=count)
+        chars = slots[rows]
+        is_consonant = consonant_mask[rows]
+        is_vowel = vowel_mask[rows]
+        
+        chars[is_consonant] = consonants[
+            self._np_rng.integers(0, len(consonants), size=int(is_consonant.sum()))
+        ]
+        chars[is_vowel] = vowels[
+            self._np_rng.integers(0, len(vowels), size=int(is_vowel.sum()))
+        ]
+        
+        if as_bytes:
+            return chars.astype("S1").view(f"S{length}").ravel().tolist()
+        return chars.view(f"U{length}").ravel().tolist()
+    
+    def _specialized(
+        self,
+        length: int,
+        pattern: Optional[str],
+        prefix: Optional[str],
+        suffix: Optional[str],
+        tlds: List[str],
+        as_bytes: bool = False,
+    ) -> Callable[[int], Union[List[str], List[bytes]]]:
+        """
+        Return a generator function specialized for one set of parameters.
+        
+        The pattern, prefix, suffix and TLDs are folded into generated source
+        so the per-name loop is a plain string concatenation. Functions are
+        cached per parameter set, up to CACHE_MAX_ENTRIES.
+        """
+        key = (length, pattern, prefix, suffix, tuple(tlds), as_bytes, self.vowels, self.consonants)
+        fn = self._codegen_cache.get(key)
+        if fn is not None:
+            self._codegen_cache.move_to_end(key)
+            return fn
+        
+        def literal_src(text: str) -> str:
+            """Source literal for a run of fixed characters."""
+            return repr(text.encode("ascii") if as_bytes else text)
+        
+        exprs = []
+        consonants_per_name = vowels_per_name = 0
+        for slots in self._slot_variants(length, pattern):
+            # Slots overwritten by the prefix/suffix are never drawn
+            chars = [(False, c) if c in "CV" else (True, c) for c in slots]
+            if prefix:
+                chars = [(True, c) for c in prefix] + chars[len(prefix):]
+            if suffix:
+                chars = chars[:-len(suffix)] + [(True, c) for c in suffix]
             
-            if suffix and not name.endswith(suffix):
-                name = name[:-len(suffix)] + suffix
+            consonants_per_name = max(consonants_per_name, chars.count((False, "C")))
+            vowels_per_name = max(vowels_per_name, chars.count((False, "V")))
             
-            # Add TLDs
-            for tld in tlds:
-                names.append(f"{name}.{tld}")
+            parts = []
+            literal = ""
+            for is_literal, c in chars:
+                if is_literal:
+                    literal += c
+                    continue
+                if literal:
+                    parts.append(literal_src(literal))
+                    literal = ""
+                parts.append("next_c()" if c == "C" else "next_v()")
+            if literal:
+                parts.append(literal_src(literal))
+            exprs.append(" + ".join(parts) or literal_src(""))
         
-        return names
-    
-    def _generate_cvccvc(self, length: int) -> str:
-        """Generate a name using alternating consonant-vowel pattern."""
-        name = ""
-        use_consonant = random.choice([True, False])
-        
-        for _ in range(length):
-            if use_consonant:
-                name += random.choice(self.consonants)
-            else:
-                name += random.choice(self.vowels)
-            use_consonant = not use_consonant
-        
-        return name
+        if len(exprs) == 1:
+            body = [f"        name = {exprs[0]}"]
+        else:
+            body = [
+                "        if rnd() < 0.5:",
+                f"            name = {exprs[0]}",
+                "        else:",
+                f"            name = {exprs[1]}",
+            ]
+        body += [f"        append(name + {literal_src('.' + tld)})" for tld in tlds]
+        
+        # Draw every character of the batch in two C-level choices() calls
+        setup = ["    rnd = rng.random"]
+        if consonants_per_name:
+            setup.append(f"    next_c = iter(rng.choices(C, k=n * {consonants_per_name})).__next__")
+        if vowels_per_name:
+            setup.append(f"    next_v = iter(rng.choices(V, k=n * {vowels_per_name})).__next__")
+        
+        src = "\n".join([
+            "def _gen(n, rng, C, V):",
+            *setup,
+            "    out = []",
+            "    append = out.append",
+            "    for _ in range(n):",
+            *body,
+            "    return out",
+        ])
+        namespace: Dict[str, object] = {}
+        exec(compile(src, "<gen>", "exec"), namespace)
+        
+        fn = functools.partial(
+            namespace["_gen"],
+            rng=self._rng,
+            C=self._alphabet(self.consonants, as_bytes),
+            V=self._alphabet(self.vowels, as_bytes),
+        )
+        self._codegen_cache[key] = fn
+        if len(self._codegen_cache) > self.CACHE_MAX_ENTRIES:
+            self._codegen_cache.popitem(last=False)
+        return fn
     
-    def _generate_by_pattern(self, length: int, pattern: str) -> str:
-        """Generate a name by a specific pattern (e.g., CVCCVC)."""
-        if len(pattern) != length:
-            # Fallback if pattern length doesn't match
-            return self._generate_cvccvc(length)
-        
-        name = ""
-        for char in pattern.upper():
-            if char == 'C':
-                name += random.choice(self.consonants)
-            elif char == 'V':
-                name += random.choice(self.vowels)
-            else:
-                name += char
-        
-        return name
+    @staticmethod
+    def _alphabet(letters: str, as_bytes: bool) -> Union[str, List[bytes]]:
+        """Return letters as a sequence whose items are single characters."""
+        if as_bytes:
+            return [bytes([c]) for c in letters.encode("ascii")]
+        return letters
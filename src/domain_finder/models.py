@@ -2,15 +2,29 @@
 Data models for domain finder
 """
 
-from typing import Optional, List
+import sys
+from dataclasses import dataclass, field
+from typing import Optional, List, TypedDict, Union
 from pydantic import BaseModel, Field
 
 
-class DomainCheckResult(BaseModel):
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class DomainCheckResult:
     """Result of checking a single domain."""
-    domain: str
-    status: str = Field(..., description="AVAILABLE, TAKEN, or UNKNOWN")
-    ip: Optional[str] = Field(None, description="IP address if TAKEN")
+    domain: Union[str, bytes]
+    status: str = field(metadata={"description": "AVAILABLE, TAKEN, or UNKNOWN"})
+    ip: Optional[str] = field(default=None, metadata={"description": "IP address if TAKEN"})
+
+
+class DomainCheckResultDict(TypedDict):
+    """Dictionary form of DomainCheckResult, as returned by AvailabilityChecker."""
+    domain: Union[str, bytes]  # as passed to the checker
+    status: str
+    ip: Optional[str]
 
 
 class GenerationConfig(BaseModel):
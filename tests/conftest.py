@@ -0,0 +1,9 @@
+"""
+Shared pytest configuration
+"""
+
+import os
+import sys
+
+# Import the package from src/ without requiring an install
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
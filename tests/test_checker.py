@@ -0,0 +1,234 @@
+"""
+Tests for the pipelined DNS client behind AvailabilityChecker.check_batch
+"""
+
+import socket
+import threading
+
+import dns.message
+import dns.rcode
+import dns.rrset
+import pytest
+
+from domain_finder import checker as checker_module
+from domain_finder.checker import AvailabilityChecker, _RawDnsBatch
+
+
+class _Responder(threading.Thread):
+    """
+    Local UDP DNS server whose answer depends on the first label:
+    nx -> NXDOMAIN, a -> 192.0.2.1, nodata -> empty NOERROR,
+    flaky -> dropped once then answered, anything else -> dropped.
+    """
+    
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.settimeout(0.05)
+        self.address = self.sock.getsockname()
+        self.queries = []
+        self._stopped = threading.Event()
+    
+    def run(self):
+        while not self._stopped.is_set():
+            try:
+                wire, client = self.sock.recvfrom(512)
+            except socket.timeout:
+                continue
+            query = dns.message.from_wire(wire)
+            name = query.question[0].name.to_text()
+            self.queries.append(name)
+            response = self._answer(query, name)
+            if response is not None:
+                self.sock.sendto(response.to_wire(), client)
+    
+    def _answer(self, query, name):
+        label = name.split(".")[0]
+        response = dns.message.make_response(query)
+        if label == "nx":
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        elif label == "a" or (label == "flaky" and self.queries.count(name) > 1):
+            response.answer.append(
+                dns.rrset.from_text(query.question[0].name, 60, "IN", "A", "192.0.2.1")
+            )
+        elif label != "nodata":
+            return None
+        return response
+    
+    def stop(self):
+        self._stopped.set()
+        self.join()
+        self.sock.close()
+
+
+@pytest.fixture
+def responder():
+    server = _Responder()
+    server.start()
+    yield server
+    server.stop()
+
+
+def _closed_port():
+    """Return a local UDP port nothing is listening on."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def _resolve(nameservers, domains, retry_attempts=0):
+    batch = _RawDnsBatch(nameservers, timeout=0.3, retry_attempts=retry_attempts)
+    try:
+        return batch.resolve(domains, window=10)
+    finally:
+        batch.close()
+
+
+def test_nxdomain_is_available(responder):
+    results = _resolve([responder.address], ["nx.test"])
+    assert results["nx.test"] == {"domain": "nx.test", "status": "AVAILABLE", "ip": None}
+
+
+def test_a_record_is_taken(responder):
+    results = _resolve([responder.address], ["a.test", b"a.example"])
+    assert results["a.test"] == {"domain": "a.test", "status": "TAKEN", "ip": "192.0.2.1"}
+    assert results[b"a.example"]["status"] == "TAKEN"
+
+
+def test_nodata_is_unknown(responder):
+    results = _resolve([responder.address], ["nodata.test"])
+    assert results["nodata.test"]["status"] == "UNKNOWN"
+
+
+def test_dropped_reply_is_unknown_after_retries(responder):
+    results = _resolve([responder.address], ["drop.test"], retry_attempts=2)
+    assert results["drop.test"]["status"] == "UNKNOWN"
+    assert responder.queries.count("drop.test.") == 3
+
+
+def test_lost_query_is_retried(responder):
+    results = _resolve([responder.address], ["flaky.test", "nx.test"], retry_attempts=1)
+    assert results["flaky.test"]["status"] == "TAKEN"
+    assert results["nx.test"]["status"] == "AVAILABLE"
+    assert responder.queries.count("flaky.test.") == 2
+    assert responder.queries.count("nx.test.") == 1
+
+
+def test_invalid_names_are_unknown_and_never_sent(responder):
+    invalid = ["a..b", "x" * 64 + ".com", "", "-x.test", b"caf\xc3\xa9.test"]
+    results = _resolve([responder.address], invalid + ["a.test"])
+    for domain in invalid:
+        assert results[domain]["status"] == "UNKNOWN"
+    assert responder.queries == ["a.test."]
+
+
+def test_fails_over_to_next_nameserver(responder):
+    dead = ("127.0.0.1", _closed_port())
+    results = _resolve([dead, responder.address], ["a.test"], retry_attempts=1)
+    assert results["a.test"]["status"] == "TAKEN"
+
+
+def test_no_nameservers_is_unknown():
+    results = _resolve([], ["a.test"], retry_attempts=2)
+    assert results["a.test"]["status"] == "UNKNOWN"
+
+
+def test_socket_setup_failure_is_unknown(monkeypatch):
+    def unreachable(*args, **kwargs):
+        raise OSError(101, "Network is unreachable")
+    
+    monkeypatch.setattr(checker_module.socket, "socket", unreachable)
+    results = _resolve([("192.0.2.53", 53)], ["a.test"], retry_attempts=1)
+    assert results["a.test"]["status"] == "UNKNOWN"
+
+
+def test_check_batch_caches_only_definitive_results(responder):
+    checker = AvailabilityChecker(timeout=0.3, retry_attempts=0)
+    checker._raw_batch = _RawDnsBatch([responder.address], 0.3, 0)
+    try:
+        results = checker.check_batch(["a.test", "drop.test", "a.test"])
+        assert [r["status"] for r in results] == ["TAKEN", "UNKNOWN", "TAKEN"]
+        assert checker.is_known_taken("a.test")
+        
+        checker.check_batch(["a.test", "drop.test"])
+        assert responder.queries.count("a.test.") == 1
+        assert responder.queries.count("drop.test.") == 2
+    finally:
+        checker.close()
+
+
+@pytest.mark.parametrize("errno, status", [
+    (socket.EAI_NONAME, "AVAILABLE"),
+    (getattr(socket, "EAI_NODATA", -5), "UNKNOWN"),
+    (socket.EAI_AGAIN, "UNKNOWN"),
+])
+def test_check_classifies_getaddrinfo_errors(monkeypatch, errno, status):
+    def fail(*args, **kwargs):
+        raise socket.gaierror(errno, "lookup failed")
+    
+    monkeypatch.setattr(checker_module.socket, "getaddrinfo", fail)
+    checker = AvailabilityChecker()
+    assert checker.check("name.test")["status"] == status
+    assert checker.is_known_taken("name.test") is False
+    cached = checker._cache_get(checker._system_cache, "name.test")
+    assert (cached is not None) == (status == "AVAILABLE")
+
+
+def test_check_does_not_leak_into_check_batch(monkeypatch, responder):
+    # The system resolver says TAKEN (e.g. from /etc/hosts); DNS says NXDOMAIN
+    monkeypatch.setattr(
+        checker_module.socket, "getaddrinfo",
+        lambda *args, **kwargs: [(socket.AF_INET, socket.SOCK_DGRAM, 0, "", ("127.0.0.1", 0))]
+    )
+    checker = AvailabilityChecker(timeout=0.3, retry_attempts=0)
+    checker._raw_batch = _RawDnsBatch([responder.address], 0.3, 0)
+    try:
+        assert checker.check("nx.test")["status"] == "TAKEN"
+        assert not checker.is_known_taken("nx.test")
+        assert checker.check_batch(["nx.test"])[0]["status"] == "AVAILABLE"
+        assert responder.queries == ["nx.test."]
+        assert checker.check("nx.test")["status"] == "TAKEN"
+    finally:
+        checker.close()
+
+
+def test_missing_resolver_configuration_is_retried(monkeypatch, responder):
+    checker = AvailabilityChecker(timeout=0.3, retry_attempts=0)
+    
+    def unconfigured():
+        raise checker_module.dns.resolver.NoResolverConfiguration("no nameservers")
+    
+    monkeypatch.setattr(checker, "_get_resolver", unconfigured)
+    assert checker.check_batch(["a.test"])[0]["status"] == "UNKNOWN"
+    assert checker._raw_batch is None
+    
+    resolver = checker_module.dns.resolver.Resolver(configure=False)
+    resolver.nameservers = [responder.address[0]]
+    resolver.port = responder.address[1]
+    monkeypatch.setattr(checker, "_get_resolver", lambda: resolver)
+    try:
+        assert checker.check_batch(["a.test"])[0]["status"] == "TAKEN"
+    finally:
+        checker.close()
+
+
+def test_encode_qname_accepts_full_length_names():
+    name = ".".join(["a" * 63] * 3 + ["b" * 61])
+    assert len(name) == 253
+    wire = checker_module._encode_qname(name + ".")
+    assert wire == checker_module._encode_qname(name.upper())
+    assert len(wire) == 255
+    with pytest.raises(ValueError):
+        checker_module._encode_qname(name + "b")
+
+
+@pytest.mark.parametrize("domain", [
+    "under_score.com", "-lead.com", "trail-.com", "sp ace.com", "a.com..",
+    b"caf\xc3\xa9.com", b"nul\x00.com",
+])
+def test_encode_qname_rejects_non_hostname_labels(domain):
+    with pytest.raises(ValueError):
+        checker_module._encode_qname(domain)
@@ -0,0 +1,56 @@
+"""
+Tests for DomainFinder round sizing
+"""
+
+from domain_finder.finder import DomainFinder
+from domain_finder.generator import NameGenerator
+
+
+class _RecordingGenerator(NameGenerator):
+    """NameGenerator that records the count of every generate() call."""
+    
+    def __init__(self):
+        super().__init__()
+        self.counts = []
+    
+    def generate(self, count=50, **kwargs):
+        self.counts.append(count)
+        return super().generate(count=count, **kwargs)
+
+
+class _EveryNthAvailable:
+    """Checker stub: every nth domain it is asked about is AVAILABLE."""
+    
+    def __init__(self, n):
+        self.n = n
+        self.checked = 0
+    
+    def is_known_taken(self, domain):
+        return False
+    
+    def check_batch(self, domains):
+        results = []
+        for domain in domains:
+            self.checked += 1
+            status = "AVAILABLE" if self.checked % self.n == 0 else "TAKEN"
+            results.append({"domain": domain, "status": status, "ip": None})
+        return results
+
+
+def test_rounds_are_sized_from_remaining_need():
+    generator = _RecordingGenerator()
+    finder = DomainFinder(generator, _EveryNthAvailable(50))
+    
+    found = finder.find_available(20, length=8)
+    
+    assert len(found) == 20
+    # 200 names found 4; the other 16 at 1 in 50, plus 25% headroom
+    assert generator.counts == [200, 1000]
+
+
+def test_rounds_are_capped():
+    generator = _RecordingGenerator()
+    finder = DomainFinder(generator, _EveryNthAvailable(10 ** 9), max_rounds=6)
+    
+    assert finder.find_available(1000, length=8) == []
+    assert max(generator.counts) == DomainFinder.MAX_BATCH
@@ -0,0 +1,124 @@
+"""
+Tests for NameGenerator, on both the NumPy and the pure-Python path
+"""
+
+import pytest
+
+from domain_finder import generator as generator_module
+from domain_finder.generator import NameGenerator
+
+
+@pytest.fixture(params=["numpy", "python"])
+def gen(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(generator_module, "np", None)
+    return NameGenerator()
+
+
+def test_alphabet_changes_apply_after_construction(gen):
+    gen.generate(count=5)
+    gen.consonants = "x"
+    gen.vowels = "y"
+    names = gen.generate(count=20, length=4)
+    assert set(names) <= {"xyxy.com", "yxyx.com"}
+
+
+def _classes(name, consonants=NameGenerator.CONSONANTS, vowels=NameGenerator.VOWELS):
+    """Map each character to C, V or itself."""
+    return "".join(
+        "C" if c in consonants else "V" if c in vowels else c for c in name
+    )
+
+
+def test_pattern_literals_are_kept(gen):
+    names = gen.generate(count=50, length=5, pattern="cv7vc")
+    assert len(names) == 50
+    for name in names:
+        base, tld = name.split(".")
+        assert tld == "com"
+        assert _classes(base) == "CV7VC"
+
+
+def test_unpatterned_names_alternate(gen):
+    names = gen.generate(count=200, length=5)
+    assert {_classes(name.split(".")[0]) for name in names} == {"CVCVC", "VCVCV"}
+
+
+def test_prefix_and_suffix_overwrite(gen):
+    names = gen.generate(count=50, length=6, pattern="CVCVCV", prefix="go", suffix="ly")
+    for name in names:
+        base = name.split(".")[0]
+        assert len(base) == 6
+        assert base.startswith("go") and base.endswith("ly")
+        assert _classes(base[2:4]) == "CV"
+
+
+def test_prefix_longer_than_length(gen):
+    assert gen.generate(count=3, length=3, prefix="hello") == ["hello.com"] * 3
+    assert gen.generate(count=2, length=3, prefix="hello", suffix="xy") == ["helxy.com"] * 2
+
+
+def test_multiple_tlds(gen):
+    names = gen.generate(count=10, length=4, tlds=["com", "io", "co"])
+    assert len(names) == 30
+    for i in range(0, 30, 3):
+        base = names[i].split(".")[0]
+        assert names[i:i + 3] == [f"{base}.com", f"{base}.io", f"{base}.co"]
+
+
+def test_as_bytes(gen):
+    names = gen.generate(count=20, length=4, pattern="CVCV", prefix="z", tlds=["com", "io"], as_bytes=True)
+    assert len(names) == 40
+    for name in names:
+        assert isinstance(name, bytes)
+        base, tld = name.decode("ascii").split(".")
+        assert tld in ("com", "io")
+        assert base[0] == "z" and _classes(base[1:]) == "VCV"
+
+
+def test_zero_count(gen):
+    assert gen.generate(count=0) == []
+    assert gen.generate(count=0, as_bytes=True) == []
+
+
+def test_paths_agree_on_character_classes(monkeypatch):
+    cases = [
+        {"length": 6},
+        {"length": 6, "pattern": "CVCCVC"},
+        {"length": 5, "pattern": "VC-CV", "prefix": "x", "suffix": "o"},
+        {"length": 2, "prefix": "abc"},
+    ]
+    per_path = []
+    for numpy_available in (True, False):
+        if not numpy_available:
+            monkeypatch.setattr(generator_module, "np", None)
+        gen = NameGenerator()
+        per_path.append([
+            {_classes(name.split(".")[0]) for name in gen.generate(count=200, **case)}
+            for case in cases
+        ])
+    assert per_path[0] == per_path[1]
+
+
+def test_compiled_generators_are_bounded(monkeypatch):
+    monkeypatch.setattr(generator_module, "np", None)
+    monkeypatch.setattr(NameGenerator, "CACHE_MAX_ENTRIES", 4)
+    gen = NameGenerator()
+    for i in range(10):
+        gen.generate(count=1, prefix=str(i))
+    assert len(gen._codegen_cache) == 4
+    
+    # Recently used entries survive eviction
+    gen.generate(count=1, prefix="6")
+    gen.generate(count=1, prefix="new")
+    assert (4, None, "6", None, ("com",), False, gen.vowels, gen.consonants) in gen._codegen_cache
+
+
+def test_slot_tables_are_bounded(monkeypatch):
+    if generator_module.np is None:
+        pytest.skip("numpy is not installed")
+    monkeypatch.setattr(NameGenerator, "CACHE_MAX_ENTRIES", 4)
+    gen = NameGenerator()
+    for length in range(1, 11):
+        gen.generate(count=1, length=length)
+    assert len(gen._slot_cache) == 4